@@ -12,6 +12,7 @@ urlpatterns = [
     path('log_food/', views.log_food, name='log_food'),
     path('register/', views.register, name='register'),
     path('edit_food_log/<int:log_id>/', views.edit_food_log, name='edit_food_log'),
+    path('bulk_edit_food_log/', views.bulk_edit_food_log, name='bulk_edit_food_log'),
     path(
         'fooditem-autocomplete/',
         views.FoodItemAutocomplete.as_view(),
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import FoodItem, FoodItemLog
+from .models import FoodItem, FoodItemLog, DailyLogSummary
 
 admin.site.register(FoodItem)
-admin.site.register(FoodItemLog)
\ No newline at end of file
+admin.site.register(FoodItemLog)
+admin.site.register(DailyLogSummary)
\ No newline at end of file
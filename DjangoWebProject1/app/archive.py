@@ -0,0 +1,135 @@
+"""
+Archival of old FoodItemLog entries into DailyLogSummary rows.
+
+Entries older than settings.FOOD_LOG_ARCHIVE_DAYS are folded into one
+summary row per user and day and removed from the live table. Readers use
+daily_totals(), which merges archived summaries with live entries.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import DailyLogSummary, FoodItemLog
+
+TOTAL_FIELDS = ('total_calories', 'total_proteins', 'total_carbohydrates', 'total_fats')
+
+# Per-100g nutrient column for each summary total.
+NUTRIENT_FIELDS = {
+    'total_calories': 'calories_per_100g',
+    'total_proteins': 'proteins_per_100g',
+    'total_carbohydrates': 'carbohydrates_per_100g',
+    'total_fats': 'fats_per_100g',
+}
+
+
+def log_totals():
+    """Aggregate expressions computing the summary totals from FoodItemLog rows."""
+    totals = {
+        field: Sum(F('quantity_in_grams') * F(f'food_item__{nutrient}') / 100)
+        for field, nutrient in NUTRIENT_FIELDS.items()
+    }
+    totals['entry_count'] = Count('id')
+    return totals
+
+
+def archive_cutoff(today=None):
+    """First date that stays in the live table."""
+    today = today or timezone.localdate()
+    return today - timedelta(days=settings.FOOD_LOG_ARCHIVE_DAYS)
+
+
+def archive_food_logs(cutoff=None, batch_size=1000):
+    """
+    Move FoodItemLog entries dated before ``cutoff`` into DailyLogSummary.
+
+    The backlog is processed one calendar month at a time, each month in its
+    own transaction, so memory use and lock time stay bounded however large
+    the live table has grown. Totals are added to any existing summary for
+    the same user and day, so entries logged for an already archived day are
+    merged on the next run. Returns the number of archived entries.
+    """
+    cutoff = cutoff or archive_cutoff()
+    first_date = (FoodItemLog.objects.filter(date__lt=cutoff)
+                  .order_by('date').values_list('date', flat=True).first())
+    if first_date is None:
+        return 0
+
+    archived = 0
+    month_start = first_date.replace(day=1)
+    while month_start < cutoff:
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        archived += _archive_slice(month_start, min(next_month, cutoff), batch_size)
+        month_start = next_month
+    return archived
+
+
+def _archive_slice(start, end, batch_size):
+    """Archive the entries dated in [start, end) in one transaction."""
+    with transaction.atomic():
+        # Lock the slice and pin its primary keys: the aggregate and the delete
+        # only touch these rows, so entries added concurrently are never
+        # deleted without being counted; they are archived on the next run.
+        pks = list(
+            FoodItemLog.objects.select_for_update()
+            .filter(date__gte=start, date__lt=end)
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        if not pks:
+            return 0
+        batches = [pks[index:index + batch_size] for index in range(0, len(pks), batch_size)]
+
+        totals = {}
+        for batch in batches:
+            rows = (FoodItemLog.objects.filter(pk__in=batch)
+                    .values('user_id', 'date').annotate(**log_totals()).order_by())
+            for row in rows:
+                day = totals.setdefault((row['user_id'], row['date']),
+                                        dict.fromkeys(('entry_count',) + TOTAL_FIELDS, 0))
+                for field in day:
+                    day[field] += row[field] or 0
+
+        existing = {
+            (summary.user_id, summary.date): summary
+            for summary in DailyLogSummary.objects.filter(date__gte=start, date__lt=end)
+        }
+        to_create, to_update = [], []
+        for (user_id, date), day in totals.items():
+            summary = existing.get((user_id, date))
+            if summary is None:
+                to_create.append(DailyLogSummary(user_id=user_id, date=date, **day))
+                continue
+            summary.entry_count += day['entry_count']
+            for field in TOTAL_FIELDS:
+                setattr(summary, field, getattr(summary, field) + day[field])
+            to_update.append(summary)
+
+        DailyLogSummary.objects.bulk_create(to_create, batch_size=batch_size)
+        DailyLogSummary.objects.bulk_update(
+            to_update, ('entry_count',) + TOTAL_FIELDS, batch_size=batch_size)
+        for batch in batches:
+            FoodItemLog.objects.filter(pk__in=batch).delete()
+    return len(pks)
+
+
+def daily_totals(user, start, end):
+    """
+    Return {date: {total_*: value}} for ``user`` between ``start`` and ``end``.
+
+    Archived days come from DailyLogSummary and recent days from FoodItemLog;
+    a day present in both (logged after it was archived) gets both added up.
+    """
+    totals = {}
+    summaries = DailyLogSummary.objects.filter(
+        user=user, date__range=(start, end)).values('date', *TOTAL_FIELDS)
+    live = FoodItemLog.objects.filter(
+        user=user, date__range=(start, end)).values('date').annotate(**log_totals()).order_by()
+
+    for row in list(summaries) + list(live):
+        day = totals.setdefault(row['date'], dict.fromkeys(TOTAL_FIELDS, 0))
+        for field in TOTAL_FIELDS:
+            day[field] += row[field] or 0
+    return totals
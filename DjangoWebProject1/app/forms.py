@@ -6,7 +6,7 @@ from django import forms
 from django.contrib.auth.forms import AuthenticationForm
 from django.utils.translation import gettext_lazy as _
 from dal import autocomplete
-from .models import FoodItemLog, FoodItem, Profile
+from .models import FoodItemLog, FoodItem, Profile, DailyLogSummary
 
 class BootstrapAuthenticationForm(AuthenticationForm):
     """Authentication form which uses bootstrap CSS."""
@@ -72,3 +72,69 @@ class ProfileForm(forms.ModelForm):
             'age': forms.NumberInput(attrs={'class': 'form-control'}),
             'gender': forms.Select(attrs={'class': 'form-control'}),
         }
+
+
+class BulkFoodItemLogForm(forms.Form):
+    ACTION_CHOICES = (
+        ('delete', 'Delete entries'),
+        ('move', 'Move entries to another date'),
+        ('rescale', 'Rescale quantities'),
+    )
+    start_date = forms.DateField(widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}))
+    end_date = forms.DateField(widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}))
+    food_item = forms.ModelChoiceField(
+        queryset=FoodItem.objects.all(),
+        required=False,
+        help_text='Leave empty to select every food.',
+        widget=autocomplete.ModelSelect2(
+            url='fooditem-autocomplete',
+            attrs={
+                'data-placeholder': 'Any Food Item',
+                'class': 'form-control'
+            }
+        ),
+    )
+    action = forms.ChoiceField(choices=ACTION_CHOICES, widget=forms.Select(attrs={'class': 'form-control'}))
+    target_date = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}))
+    factor = forms.FloatField(
+        required=False,
+        max_value=10,
+        help_text='Quantities are multiplied by this factor (at most 10).',
+        widget=forms.NumberInput(attrs={'class': 'form-control', 'step': 'any'}))
+    # Set by the confirmation step that precedes a delete
+    confirm = forms.BooleanField(required=False, widget=forms.HiddenInput)
+
+    def __init__(self, *args, user=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+
+    def _archived_days(self, **date_filter):
+        """Dates of the user's days that only exist as DailyLogSummary rows."""
+        return (DailyLogSummary.objects.filter(user=self.user, **date_filter)
+                .order_by('date').values_list('date', flat=True))
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_date = cleaned_data.get('start_date')
+        end_date = cleaned_data.get('end_date')
+        action = cleaned_data.get('action')
+
+        if start_date and end_date and start_date > end_date:
+            raise forms.ValidationError("Start date must not be after end date.")
+        if start_date and end_date:
+            archived = self._archived_days(date__range=(start_date, end_date)).first()
+            if archived:
+                self.add_error('start_date', f"Entries on {archived} are archived and cannot be edited.")
+        if action == 'move':
+            target_date = cleaned_data.get('target_date')
+            if not target_date:
+                self.add_error('target_date', "Choose the date to move entries to.")
+            elif self._archived_days(date=target_date).exists():
+                self.add_error('target_date', f"Entries cannot be moved to {target_date}; it is archived.")
+        if action == 'rescale':
+            factor = cleaned_data.get('factor')
+            if factor is None or factor <= 0:
+                self.add_error('factor', "Factor must be greater than 0.")
+        return cleaned_data
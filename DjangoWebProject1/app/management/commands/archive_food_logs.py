@@ -0,0 +1,34 @@
+"""
+Fold old FoodItemLog entries into DailyLogSummary rows.
+
+Example:
+    python manage.py archive_food_logs --days 365
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from app.archive import archive_cutoff, archive_food_logs
+
+
+class Command(BaseCommand):
+    help = 'Moves food log entries older than the archive horizon into daily summaries.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None,
+            help='Archive entries older than this many days (defaults to FOOD_LOG_ARCHIVE_DAYS).')
+
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is None:
+            cutoff = archive_cutoff()
+        elif days < 0:
+            raise CommandError('--days must not be negative.')
+        else:
+            cutoff = timezone.localdate() - timedelta(days=days)
+
+        archived = archive_food_logs(cutoff)
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} food log entries dated before {cutoff}.'))
@@ -0,0 +1,18 @@
+"""
+Rebuild the purged stylesheets in app/static/app/content.
+
+Run after changing the classes used by the templates:
+    python manage.py purge_css
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.purgecss import purge_assets
+
+
+class Command(BaseCommand):
+    help = 'Writes copies of app/assets stylesheets without the rules the templates do not use.'
+
+    def handle(self, *args, **options):
+        for name, before, after in purge_assets():
+            self.stdout.write(f'{name}: {before} -> {after} bytes')
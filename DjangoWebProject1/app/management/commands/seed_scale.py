@@ -0,0 +1,123 @@
+"""
+Generate users, a food catalogue and years of food logs for scale testing.
+
+Example:
+    python manage.py seed_scale --users 10000 --foods 50000 --years 3 --seed 42
+"""
+
+import os
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from app import seeding
+from app.models import FoodItem, FoodItemLog, Profile
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generates deterministic synthetic users, food items and food logs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--foods', type=int, default=1000)
+        parser.add_argument('--years', type=int, default=1)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--end-date', default=None,
+            help='Last logged day as YYYY-MM-DD (defaults to today). '
+                 'Fix it together with --seed for fully reproducible data.')
+        parser.add_argument('--prefix', default='seed_', help='Username prefix of generated users.')
+        parser.add_argument('--password', default='seed-password')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--chunk-size', type=int, default=50, help='Users per generation chunk.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT.')
+
+    def handle(self, *args, **options):
+        users, foods = options['users'], options['foods']
+        if users < 1 or foods < 1 or options['years'] < 1:
+            raise CommandError('--users, --foods and --years must be positive.')
+        prefix = options['prefix']
+        if User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(f'Users with prefix "{prefix}" already exist; pick another --prefix.')
+
+        try:
+            end_date = (datetime.strptime(options['end_date'], '%Y-%m-%d').date()
+                        if options['end_date'] else timezone.localdate())
+        except ValueError:
+            raise CommandError(f'Invalid --end-date "{options["end_date"]}"; expected YYYY-MM-DD.')
+        days = options['years'] * 365
+        start_date = end_date - timedelta(days=days - 1)
+        seed, batch_size = options['seed'], options['batch_size']
+
+        food_ids = self._create_food_items(seed, foods, batch_size)
+        user_ids = self._create_users(seed, users, prefix, options['password'], batch_size)
+        self.stdout.write(f'Created {len(user_ids)} users and {len(food_ids)} food items.')
+
+        chunk_size = options['chunk_size']
+        tasks = [
+            (seed, index, user_ids[start:start + chunk_size], foods, start_date, days)
+            for index, start in enumerate(range(0, len(user_ids), chunk_size))
+        ]
+
+        total = 0
+        if options['workers'] > 1:
+            with Pool(options['workers']) as pool:
+                for rows in pool.imap(seeding.generate_log_chunk, tasks):
+                    total += self._insert_logs(rows, food_ids, batch_size)
+        else:
+            for task in tasks:
+                total += self._insert_logs(seeding.generate_log_chunk(task), food_ids, batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {total} food log entries from {start_date} to {end_date}.'))
+
+    def _create_food_items(self, seed, count, batch_size):
+        last_id = FoodItem.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        FoodItem.objects.bulk_create(
+            (FoodItem(**fields) for fields in seeding.generate_food_items(seed, count)),
+            batch_size=batch_size,
+        )
+        return list(FoodItem.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True))
+
+    def _create_users(self, seed, count, prefix, password, batch_size):
+        # Hash once: the hasher is deliberately slow and would dominate the run.
+        password_hash = make_password(password)
+        width = len(str(count))
+        User.objects.bulk_create(
+            (User(username=f'{prefix}{index:0{width}d}', password=password_hash)
+             for index in range(count)),
+            batch_size=batch_size,
+        )
+        user_ids = list(
+            User.objects.filter(username__startswith=prefix).order_by('username').values_list('pk', flat=True)
+        )
+        # bulk_create skips post_save, so create_user_profile never runs here.
+        Profile.objects.bulk_create(
+            (Profile(user_id=user_id, **fields)
+             for user_id, fields in zip(user_ids, seeding.generate_profiles(seed, count))),
+            batch_size=batch_size,
+        )
+        return user_ids
+
+    def _insert_logs(self, rows, food_ids, batch_size):
+        # Plain executemany on row tuples: building a FoodItemLog instance per
+        # row for bulk_create costs far more than generating the row.
+        ops = connection.ops
+        columns = ', '.join(
+            ops.quote_name(FoodItemLog._meta.get_field(name).column)
+            for name in ('user', 'food_item', 'date', 'quantity_in_grams')
+        )
+        sql = f'INSERT INTO {ops.quote_name(FoodItemLog._meta.db_table)} ({columns}) VALUES (%s, %s, %s, %s)'
+        adapt_date = ops.adapt_datefield_value
+        with transaction.atomic(), connection.cursor() as cursor:
+            for start in range(0, len(rows), batch_size):
+                cursor.executemany(sql, [
+                    (user_id, food_ids[food_index], adapt_date(day), quantity)
+                    for user_id, food_index, day, quantity in rows[start:start + batch_size]
+                ])
+        return len(rows)
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-19 20:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_profile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyLogSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('entry_count', models.IntegerField(default=0)),
+                ('total_calories', models.FloatField(default=0)),
+                ('total_proteins', models.FloatField(default=0)),
+                ('total_carbohydrates', models.FloatField(default=0)),
+                ('total_fats', models.FloatField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='unique_daily_summary_per_user')],
+            },
+        ),
+    ]
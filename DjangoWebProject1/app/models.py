@@ -35,6 +35,24 @@ class FoodItemLog(models.Model):
     @property
     def total_fats(self):
         return (self.quantity_in_grams / 100) * self.food_item.fats_per_100g
+
+class DailyLogSummary(models.Model):
+    """Per-user daily totals of FoodItemLog entries that have been archived."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    date = models.DateField()
+    entry_count = models.IntegerField(default=0)
+    total_calories = models.FloatField(default=0)
+    total_proteins = models.FloatField(default=0)
+    total_carbohydrates = models.FloatField(default=0)
+    total_fats = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_daily_summary_per_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.date}: {self.total_calories:.0f} kcal"
     
 
 class Profile(models.Model):
@@ -0,0 +1,143 @@
+"""
+Removal of CSS rules that the templates never use.
+
+Stylesheets in app/assets are filtered against the class names found in
+the templates and forms, and the result is written to app/static/app/content
+where collectstatic picks it up. Rules without class selectors (element
+resets, @font-face, @keyframes) are always kept.
+"""
+
+import os
+import re
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(APP_DIR, 'assets')
+OUTPUT_DIR = os.path.join(APP_DIR, 'static', 'app', 'content')
+CONTENT_PATHS = [
+    os.path.join(APP_DIR, 'templates'),
+    os.path.join(APP_DIR, 'forms.py'),
+]
+
+# Classes that are only added at runtime by JavaScript.
+SAFELIST = {'show', 'active', 'disabled', 'collapse', 'collapsing', 'fade'}
+
+TOKEN_RE = re.compile(r'[A-Za-z0-9_-]+')
+CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)')
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+LICENSE_RE = re.compile(r'/\*!.*?\*/', re.DOTALL)
+# Parts of a selector that may contain dots which are not class names,
+# and :not() arguments, which only narrow the match.
+IGNORED_SELECTOR_RE = re.compile(r'"[^"]*"|\'[^\']*\'|\[[^\]]*\]|:not\([^)]*\)')
+
+
+def used_tokens(paths=None):
+    """Return every identifier-like word in the content files."""
+    tokens = set(SAFELIST)
+    for path in paths or CONTENT_PATHS:
+        if os.path.isdir(path):
+            files = [
+                os.path.join(root, name)
+                for root, dirs, names in os.walk(path)
+                for name in names
+            ]
+        else:
+            files = [path]
+        for file_path in files:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                tokens.update(TOKEN_RE.findall(f.read()))
+    return tokens
+
+
+def purge(css, used):
+    """Return ``css`` without the rules whose classes are not all in ``used``."""
+    licenses = LICENSE_RE.findall(css)
+    css = COMMENT_RE.sub('', css)
+    return '\n'.join(licenses + [_purge_rules(css, used)]) + '\n'
+
+
+def purge_assets(used=None):
+    """Purge every stylesheet in SOURCE_DIR into OUTPUT_DIR; returns (name, before, after) sizes."""
+    used = used or used_tokens()
+    results = []
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        if not name.endswith('.css'):
+            continue
+        with open(os.path.join(SOURCE_DIR, name), 'r', encoding='utf-8') as f:
+            source = f.read()
+        purged = purge(source, used)
+        with open(os.path.join(OUTPUT_DIR, name), 'w', encoding='utf-8', newline='\n') as f:
+            f.write(purged)
+        results.append((name, len(source.encode('utf-8')), len(purged.encode('utf-8'))))
+    return results
+
+
+def _purge_rules(css, used):
+    out = []
+    for statements, prelude, body in _blocks(css):
+        out.append(statements)
+        if prelude.startswith(('@media', '@supports')):
+            inner = _purge_rules(body, used)
+            if inner:
+                out.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            out.append(f'{prelude}{{{body}}}')
+        else:
+            selectors = [s for s in _split_selectors(prelude) if _selector_used(s, used)]
+            if selectors:
+                out.append(f'{",".join(selectors)}{{{body}}}')
+    return ''.join(out)
+
+
+def _blocks(css):
+    """Yield (statements, prelude, body) for each top-level block in ``css``."""
+    pos = 0
+    while True:
+        start = css.find('{', pos)
+        if start == -1:
+            return
+        # Anything up to the last ';' is a statement such as @charset or @import
+        head = css[pos:start]
+        split = head.rfind(';') + 1
+        end = _matching_brace(css, start)
+        yield head[:split].strip(), head[split:].strip(), css[start + 1:end]
+        pos = end + 1
+
+
+def _matching_brace(css, start):
+    depth = 0
+    quote = None
+    for index in range(start, len(css)):
+        char = css[index]
+        if quote:
+            if char == quote and css[index - 1] != '\\':
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError(f"Unbalanced braces in CSS starting at offset {start}")
+
+
+def _split_selectors(prelude):
+    selectors, depth, current = [], 0, ''
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            selectors.append(current.strip())
+            current = ''
+        else:
+            current += char
+    selectors.append(current.strip())
+    return selectors
+
+
+def _selector_used(selector, used):
+    classes = CLASS_RE.findall(IGNORED_SELECTOR_RE.sub('', selector))
+    return all(name in used for name in classes)
@@ -0,0 +1,127 @@
+"""
+Deterministic synthetic data generation used by the seed_scale command.
+
+Nothing in this module touches the database or imports models, so the
+generator functions can run in worker processes started with either the
+fork or the spawn method.
+"""
+
+import math
+import random
+from datetime import timedelta
+
+FOOD_NAMES = [
+    'Гречка', 'Вівсянка', 'Рис басматі', 'Сир кисломолочний', 'Кефір',
+    'Йогурт грецький', 'Борщ', 'Вареники з картоплею', 'Сало', 'Хліб житній',
+    'Куряче філе', 'Яйце куряче', 'Банан', 'Яблуко', 'Мед гречаний',
+    'Müsli', 'Crème fraîche', 'Jalapeño', 'Brötchen', 'Smørrebrød',
+    'Pâté de campagne', 'Açaí bowl', 'Gnocchi', 'Pierogi ruskie', 'Köfte',
+    'Tofu', 'Ramen', 'Hummus', 'Paella', 'Crêpe',
+]
+
+FOOD_VARIANTS = [
+    '', 'органічний', 'light', 'класичний', 'з медом', 'без цукру',
+    'à la maison', 'extra', 'домашній', 'bio', 'з сиром', 'süß',
+]
+
+MANUFACTURERS = [
+    'Галичина', 'Рошен', 'Яготинське', 'Молокія', 'Наша Ряба', 'Хуторок',
+    'Nestlé', 'Danone', 'Zott', 'Łowicz', 'Müller', 'Président',
+    'Ehrmann', 'Škoda Mlýn', 'Arla', 'Ülker',
+]
+
+# (calories, proteins, carbohydrates, fats) ranges per 100g
+MACRO_PROFILES = [
+    ((50, 120), (1, 12), (5, 25), (0, 5)),     # produce, dairy drinks
+    ((120, 250), (10, 30), (0, 15), (2, 15)),  # meat, fish, cheese
+    ((300, 400), (8, 15), (55, 80), (1, 8)),   # grains, bread
+    ((400, 600), (3, 25), (10, 60), (20, 50)), # sweets, nuts, spreads
+]
+
+# Relative frequency of the number of entries a user logs on one day.
+ENTRIES_PER_DAY = [0, 1, 2, 3, 4, 5, 6, 7]
+ENTRIES_WEIGHTS = [8, 6, 14, 24, 22, 14, 8, 4]
+
+
+def chunk_seed(seed, index):
+    """Derive a stable per-chunk seed so output does not depend on worker count."""
+    return (seed * 1_000_003 + index) & 0xFFFFFFFF
+
+
+def generate_food_items(seed, count):
+    """Return a list of FoodItem field dicts."""
+    rng = random.Random(chunk_seed(seed, -1))
+    items = []
+    for index in range(count):
+        name = rng.choice(FOOD_NAMES)
+        variant = rng.choice(FOOD_VARIANTS)
+        if variant:
+            name = f"{name} {variant}"
+        name = f"{name} №{index + 1}"
+        calories, proteins, carbs, fats = rng.choice(MACRO_PROFILES)
+        items.append({
+            'name': name[:100],
+            'manufacturer': rng.choice(MANUFACTURERS),
+            'calories_per_100g': round(rng.uniform(*calories), 1),
+            'proteins_per_100g': round(rng.uniform(*proteins), 1),
+            'carbohydrates_per_100g': round(rng.uniform(*carbs), 1),
+            'fats_per_100g': round(rng.uniform(*fats), 1),
+        })
+    return items
+
+
+def generate_profiles(seed, count):
+    """Return a list of Profile field dicts (without the user)."""
+    rng = random.Random(chunk_seed(seed, -2))
+    profiles = []
+    for _ in range(count):
+        gender = rng.choice(('M', 'F'))
+        height = rng.gauss(178 if gender == 'M' else 165, 7)
+        bmi = min(max(rng.gauss(24, 3.5), 17), 40)
+        profiles.append({
+            'height': round(height, 1),
+            'weight': round(bmi * (height / 100) ** 2, 1),
+            'age': rng.randint(16, 75),
+            'gender': gender,
+        })
+    return profiles
+
+
+def generate_log_chunk(args):
+    """
+    Generate FoodItemLog rows for a chunk of users.
+
+    ``args`` is a single tuple so the function can be used with Pool.imap:
+    (seed, chunk_index, user_ids, food_count, start_date, days).
+    Rows are (user_id, food_index, date, quantity_in_grams) tuples; food
+    indexes are resolved to primary keys by the caller.
+    """
+    seed, chunk_index, user_ids, food_count, start_date, days = args
+    rng = random.Random(chunk_seed(seed, chunk_index))
+    # Zipf-like popularity: a handful of foods make up most of the log.
+    cum_weights = list(_cumulative(1 / (rank + 1) for rank in range(food_count)))
+    rows = []
+    for user_id in user_ids:
+        # Each user has a personal pantry of favourites they mostly eat from.
+        pantry = rng.choices(range(food_count), cum_weights=cum_weights, k=min(food_count, 40))
+        activity = rng.uniform(0.3, 1.0)
+        for offset in range(days):
+            if rng.random() > activity:
+                continue
+            date = start_date + timedelta(days=offset)
+            entries = rng.choices(ENTRIES_PER_DAY, weights=ENTRIES_WEIGHTS)[0]
+            for _ in range(entries):
+                if rng.random() < 0.8:
+                    food_index = rng.choice(pantry)
+                else:
+                    food_index = rng.choices(range(food_count), cum_weights=cum_weights)[0]
+                quantity = min(max(rng.lognormvariate(math.log(150), 0.5), 5), 1500)
+                rows.append((user_id, food_index, date, round(quantity)))
+    return rows
+
+
+def _cumulative(values):
+    total = 0
+    for value in values:
+        total += value
+        yield total
@@ -3,8 +3,21 @@ This file demonstrates writing tests using the unittest module. These will pass
 when you run "manage.py test".
 """
 
+import os
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
 import django
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils import timezone
+
+from .archive import archive_food_logs, daily_totals
+from .models import DailyLogSummary, FoodItem, FoodItemLog, Profile
+from .purgecss import OUTPUT_DIR, SOURCE_DIR, purge, used_tokens
 
 # TODO: Configure your database in settings.py and sync before running tests.
 
@@ -32,3 +45,193 @@ class ViewTest(TestCase):
         """Tests the about page."""
         response = self.client.get('/about')
         self.assertContains(response, 'About', 3, 200)
+
+
+class SeedScaleCommandTest(TestCase):
+    """Tests for the seed_scale management command."""
+
+    def _seed(self, prefix, workers=1):
+        call_command(
+            'seed_scale', users=3, foods=20, years=1, seed=7, end_date='2024-12-31',
+            prefix=prefix, workers=workers, chunk_size=2, stdout=StringIO(),
+        )
+        logs = FoodItemLog.objects.filter(user__username__startswith=prefix)
+        return [
+            (log.user.username[len(prefix):], log.food_item.name, log.date, log.quantity_in_grams)
+            for log in logs.select_related('user', 'food_item').order_by('pk')
+        ]
+
+    def test_seed_creates_profiles_and_logs(self):
+        rows = self._seed('a_')
+        self.assertEqual(Profile.objects.filter(user__username__startswith='a_').count(), 3)
+        self.assertTrue(rows)
+        self.assertTrue(all(row[2].year == 2024 for row in rows))
+
+    def test_seed_is_deterministic(self):
+        self.assertEqual(self._seed('a_'), self._seed('b_'))
+
+    def test_invalid_end_date(self):
+        with self.assertRaises(CommandError):
+            call_command('seed_scale', users=1, foods=1, end_date='2025-13-01', stdout=StringIO())
+
+    def test_seed_does_not_depend_on_worker_count(self):
+        self.assertEqual(self._seed('a_', workers=1), self._seed('b_', workers=2))
+
+
+class ArchiveFoodLogsTest(TestCase):
+    """Tests for archiving old food logs into daily summaries."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('archiver', password='secret-password')
+        self.food = FoodItem.objects.create(
+            name='Гречка', manufacturer='Галичина', calories_per_100g=300, proteins_per_100g=10)
+        for day in (date(2020, 1, 1), date(2020, 1, 1), date(2020, 1, 2), date(2024, 1, 1)):
+            FoodItemLog.objects.create(user=self.user, food_item=self.food, date=day, quantity_in_grams=50)
+
+    def test_archive_moves_old_entries(self):
+        before = daily_totals(self.user, date(2020, 1, 1), date(2024, 1, 1))
+        self.assertEqual(archive_food_logs(date(2023, 1, 1)), 3)
+        self.assertEqual(FoodItemLog.objects.count(), 1)
+        summary = DailyLogSummary.objects.get(user=self.user, date=date(2020, 1, 1))
+        self.assertEqual(summary.entry_count, 2)
+        self.assertAlmostEqual(summary.total_calories, 300)
+        self.assertEqual(daily_totals(self.user, date(2020, 1, 1), date(2024, 1, 1)), before)
+
+    def test_rerun_merges_into_existing_summary(self):
+        archive_food_logs(date(2023, 1, 1))
+        FoodItemLog.objects.create(user=self.user, food_item=self.food, date=date(2020, 1, 1), quantity_in_grams=100)
+        self.assertEqual(archive_food_logs(date(2023, 1, 1)), 1)
+        summary = DailyLogSummary.objects.get(user=self.user, date=date(2020, 1, 1))
+        self.assertEqual(summary.entry_count, 3)
+        self.assertAlmostEqual(summary.total_calories, 600)
+
+    def test_archive_spans_months_and_stops_at_cutoff(self):
+        FoodItemLog.objects.create(user=self.user, food_item=self.food, date=date(2022, 12, 31), quantity_in_grams=100)
+        FoodItemLog.objects.create(user=self.user, food_item=self.food, date=date(2023, 1, 1), quantity_in_grams=100)
+        self.assertEqual(archive_food_logs(date(2023, 1, 1)), 4)
+        self.assertEqual(
+            sorted(DailyLogSummary.objects.values_list('date', flat=True)),
+            [date(2020, 1, 1), date(2020, 1, 2), date(2022, 12, 31)])
+        self.assertEqual(
+            sorted(FoodItemLog.objects.values_list('date', flat=True)), [date(2023, 1, 1), date(2024, 1, 1)])
+
+    def test_entry_added_during_archive_is_kept(self):
+        bulk_create = DailyLogSummary.objects.bulk_create
+
+        def bulk_create_with_concurrent_insert(*args, **kwargs):
+            FoodItemLog.objects.create(
+                user=self.user, food_item=self.food, date=date(2020, 1, 3), quantity_in_grams=10)
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(DailyLogSummary.objects, 'bulk_create', bulk_create_with_concurrent_insert):
+            self.assertEqual(archive_food_logs(date(2023, 1, 1), batch_size=1), 3)
+        self.assertTrue(FoodItemLog.objects.filter(date=date(2020, 1, 3)).exists())
+        self.assertEqual(DailyLogSummary.objects.get(user=self.user, date=date(2020, 1, 1)).entry_count, 2)
+
+    def test_calendar_reads_archived_days(self):
+        archive_food_logs(date(2023, 1, 1))
+        self.client.force_login(self.user)
+        response = self.client.get('/calendar/', {'year': 2020, 'month': 1})
+        self.assertEqual(response.context['calendar_data'][0]['calories'], 300)
+
+    def test_log_food_notes_archived_entries(self):
+        archive_food_logs(date(2023, 1, 1))
+        self.client.force_login(self.user)
+        response = self.client.get('/log_food/', {'date': '2020-01-01'})
+        self.assertEqual(response.context['total_calories'], 300)
+        self.assertContains(response, '2 entries archived')
+
+
+class BulkEditFoodLogTest(TestCase):
+    """Tests for the bulk food log edit view."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('bulk', password='secret-password')
+        self.other = User.objects.create_user('other', password='secret-password')
+        self.food = FoodItem.objects.create(name='Кефір', manufacturer='Галичина', calories_per_100g=50)
+        self.day = timezone.localdate()
+        for user in (self.user, self.other):
+            FoodItemLog.objects.create(user=user, food_item=self.food, date=self.day, quantity_in_grams=200)
+        self.client.force_login(self.user)
+
+    def _post(self, **data):
+        data.setdefault('start_date', self.day)
+        data.setdefault('end_date', self.day)
+        return self.client.post('/bulk_edit_food_log/', data)
+
+    def test_delete_requires_confirmation(self):
+        response = self._post(action='delete')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['pending_count'], 1)
+        self.assertContains(response, 'name="confirm" value="True"')
+        self.assertTrue(FoodItemLog.objects.filter(user=self.user).exists())
+
+    def test_delete(self):
+        response = self._post(action='delete', confirm=True)
+        self.assertRedirects(response, '/bulk_edit_food_log/', fetch_redirect_response=False)
+        self.assertFalse(FoodItemLog.objects.filter(user=self.user).exists())
+        self.assertTrue(FoodItemLog.objects.filter(user=self.other).exists())
+        self.assertEqual(self.client.get('/bulk_edit_food_log/').context['updated'], 1)
+
+    def test_move(self):
+        target = self.day + timedelta(days=1)
+        response = self._post(action='move', target_date=target)
+        self.assertEqual(FoodItemLog.objects.get(user=self.user).date, target)
+        response = self.client.get(response.url)
+        self.assertEqual([day['date'] for day in response.context['affected_days']], [self.day, target])
+
+    def test_rescale_redirects_and_refresh_does_not_repeat(self):
+        response = self._post(action='rescale', factor=1.5)
+        self.assertEqual(response.status_code, 302)
+        response = self.client.get(response.url)
+        self.assertAlmostEqual(response.context['affected_days'][0]['calories'], 150)
+        self.client.get('/bulk_edit_food_log/')
+        self.assertEqual(FoodItemLog.objects.get(user=self.user).quantity_in_grams, 300)
+        self.assertEqual(FoodItemLog.objects.get(user=self.other).quantity_in_grams, 200)
+
+    def test_rescale_factor_is_bounded(self):
+        response = self._post(action='rescale', factor=1e308)
+        self.assertIn('factor', response.context['form'].errors)
+        self.assertEqual(FoodItemLog.objects.get(user=self.user).quantity_in_grams, 200)
+
+    def test_archived_range_rejected(self):
+        # Archived with a shorter horizon than FOOD_LOG_ARCHIVE_DAYS
+        DailyLogSummary.objects.create(user=self.user, date=self.day - timedelta(days=1), entry_count=1)
+        response = self._post(action='delete', confirm=True, start_date=self.day - timedelta(days=2))
+        self.assertIn('start_date', response.context['form'].errors)
+        self.assertEqual(FoodItemLog.objects.filter(user=self.user).count(), 1)
+
+    def test_other_users_archive_does_not_block(self):
+        DailyLogSummary.objects.create(user=self.other, date=self.day, entry_count=1)
+        response = self._post(action='rescale', factor=2)
+        self.assertEqual(response.status_code, 302)
+
+    def test_move_to_archived_day_rejected(self):
+        target = self.day - timedelta(days=1)
+        DailyLogSummary.objects.create(user=self.user, date=target, entry_count=1)
+        response = self._post(action='move', target_date=target)
+        self.assertIn('target_date', response.context['form'].errors)
+        self.assertEqual(FoodItemLog.objects.get(user=self.user).date, self.day)
+
+
+class PurgeCssTest(TestCase):
+    """Tests for removing unused CSS rules."""
+
+    def test_purge_keeps_only_used_rules(self):
+        css = (
+            '/*! license */\n/* note */html{margin:0}.used{color:red}.unused,.used>.other{color:blue}'
+            '.used .also-used{top:0}@media (min-width:1px){.unused{color:red}}'
+            '@media print{.used:not(.unused){color:#000}}@keyframes spin{to{transform:rotate(1turn)}}'
+        )
+        self.assertEqual(
+            purge(css, {'used', 'also-used'}),
+            '/*! license */\nhtml{margin:0}.used{color:red}.used .also-used{top:0}'
+            '@media print{.used:not(.unused){color:#000}}@keyframes spin{to{transform:rotate(1turn)}}\n'
+        )
+
+    def test_purged_assets_are_up_to_date(self):
+        """Fails when the templates changed without re-running purge_css."""
+        with open(os.path.join(SOURCE_DIR, 'bootstrap.min.css'), encoding='utf-8') as f:
+            expected = purge(f.read(), used_tokens())
+        with open(os.path.join(OUTPUT_DIR, 'bootstrap.min.css'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), expected)
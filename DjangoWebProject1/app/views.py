@@ -8,10 +8,11 @@ from django.http import HttpRequest
 from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.db.models import F, Q
 from dal import autocomplete
-from .models import FoodItemLog, FoodItem, Profile
-from .forms import FoodItemLogForm, EditFoodItemLogForm, ProfileForm
+from .models import FoodItemLog, FoodItem, Profile, DailyLogSummary
+from .forms import FoodItemLogForm, EditFoodItemLogForm, BulkFoodItemLogForm, ProfileForm
+from .archive import daily_totals
 import unicodedata
 from calendar import monthrange
 import calendar as cal
@@ -62,10 +63,13 @@ def log_food(request: HttpRequest):
         form = FoodItemLogForm()
 
     food_item_logs = FoodItemLog.objects.filter(user=request.user, date=selected_date)
-    total_calories = sum(log.total_calories for log in food_item_logs)
-    total_proteins = sum(log.total_proteins for log in food_item_logs)
-    total_carbohydrates = sum(log.total_carbohydrates for log in food_item_logs)
-    total_fats = sum(log.total_fats for log in food_item_logs)
+    # Totals include archived entries, which are no longer listed individually
+    day_totals = daily_totals(request.user, selected_date, selected_date).get(selected_date, {})
+    total_calories = day_totals.get('total_calories', 0)
+    total_proteins = day_totals.get('total_proteins', 0)
+    total_carbohydrates = day_totals.get('total_carbohydrates', 0)
+    total_fats = day_totals.get('total_fats', 0)
+    archived_summary = DailyLogSummary.objects.filter(user=request.user, date=selected_date).first()
     
     # Add these lines
     recommended_calories = request.user.profile.daily_calories
@@ -89,6 +93,7 @@ def log_food(request: HttpRequest):
         'recommended_carbs': recommended_carbs,
         'recommended_fats': recommended_fats,
         'remaining_calories': remaining_calories,
+        'archived_entries': archived_summary.entry_count if archived_summary else 0,
         'login_required': not request.user.is_authenticated,
         'year': year,
     }
@@ -118,6 +123,68 @@ def edit_food_log(request, log_id):
         }
     )
 
+@login_required
+def bulk_edit_food_log(request):
+    """Deletes, moves or rescales every matching log entry with a single query."""
+    pending_count = None
+
+    if request.method == 'POST':
+        form = BulkFoodItemLogForm(request.POST, user=request.user)
+        if form.is_valid():
+            data = form.cleaned_data
+            logs = FoodItemLog.objects.filter(
+                user=request.user,
+                date__range=(data['start_date'], data['end_date'])
+            )
+            if data['food_item']:
+                logs = logs.filter(food_item=data['food_item'])
+
+            if data['action'] == 'delete' and not data['confirm']:
+                # Deleting cannot be undone, so show the matching count first
+                pending_count = logs.count()
+            else:
+                dates = set(logs.values_list('date', flat=True).distinct())
+                if data['action'] == 'delete':
+                    updated, _ = logs.delete()
+                elif data['action'] == 'move':
+                    updated = logs.update(date=data['target_date'])
+                    if dates:
+                        dates.add(data['target_date'])
+                else:
+                    updated = logs.update(quantity_in_grams=F('quantity_in_grams') * data['factor'])
+
+                # Recompute the totals of every affected day in one batch
+                affected_days = []
+                if dates:
+                    totals = daily_totals(request.user, min(dates), max(dates))
+                    affected_days = [
+                        {'date': day.isoformat(), 'calories': totals.get(day, {}).get('total_calories', 0)}
+                        for day in sorted(dates)
+                    ]
+                request.session['bulk_edit_result'] = {'updated': updated, 'affected_days': affected_days}
+                return redirect('bulk_edit_food_log')
+    else:
+        form = BulkFoodItemLogForm(user=request.user)
+
+    result = request.session.pop('bulk_edit_result', {}) if request.method == 'GET' else {}
+    affected_days = [
+        {'date': datetime.strptime(day['date'], '%Y-%m-%d').date(), 'calories': day['calories']}
+        for day in result.get('affected_days', [])
+    ]
+
+    return render(
+        request,
+        'app/bulk_edit_food_log.html',
+        {
+            'title': 'Bulk Edit Food Log',
+            'form': form,
+            'pending_count': pending_count,
+            'updated': result.get('updated'),
+            'affected_days': affected_days,
+            'year': datetime.now().year,
+        }
+    )
+
 @login_required
 def calendar(request):
     year = request.GET.get('year', datetime.now().year)
@@ -125,15 +192,16 @@ def calendar(request):
     year, month = int(year), int(month)
     
     first_day_of_month, days_in_month = monthrange(year, month)
-    dates = [datetime(year, month, day) for day in range(1, days_in_month + 1)]
-    
+    dates = [datetime(year, month, day).date() for day in range(1, days_in_month + 1)]
+
+    # Archived days are read from DailyLogSummary, recent ones from FoodItemLog
+    totals = daily_totals(request.user, dates[0], dates[-1])
+
     calendar_data = []
     for date in dates:
-        food_logs = FoodItemLog.objects.filter(user=request.user, date=date)
-        total_calories = sum(log.total_calories for log in food_logs)
         calendar_data.append({
             'date': date,
-            'calories': total_calories
+            'calories': totals.get(date, {}).get('total_calories', 0)
         })
     
     month_name = cal.month_name[month]